@@ -6,7 +6,7 @@ and discover frequent sequential patterns based on a user-defined minimum suppor
 Key Features:
 1. Input Handling:
    - Supports transactional data in JSON and CSV formats.
-   - Auto-detection of file type and parsing of transactions.
+   - Auto-detection of file type and parsing of transactions, sniffing the first bytes of files without extension.
    - Error handling for unsupported file formats, non-existent files, and invalid data structures.
 
 2. GSP Algorithm Integration:
@@ -31,9 +31,10 @@ import os
 import csv
 import sys
 import json
+import codecs
 import logging
 import argparse
-from typing import Dict, List, Tuple
+from typing import Any, Dict, List, Tuple, Callable, Optional, cast
 
 from gsppy.gsp import GSP
 
@@ -45,6 +46,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Read buffer for transaction files: larger reads mean fewer syscalls on big datasets
+_READ_BUFFER_SIZE = 1 << 20
+
 
 def setup_logging(verbose: bool) -> None:
     """
@@ -71,8 +75,18 @@ def read_transactions_from_json(file_path: str) -> List[List[str]]:
         ValueError: If the file cannot be read or does not contain valid JSON.
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            transactions: List[List[str]] = json.load(f)
+        with open(file_path, 'r', encoding='utf-8-sig', buffering=_READ_BUFFER_SIZE) as f:
+            raw: Any = json.load(f)
+        transactions: List[List[str]] = raw
+        if isinstance(raw, list):
+            rows = cast(List[Any], raw)
+            if all(isinstance(tx, list) for tx in rows):
+                # Share one string object per distinct item across all transactions
+                intern_map: Dict[str, str] = {}
+                transactions = [
+                    [intern_map.setdefault(item, item) if isinstance(item, str) else item for item in tx]
+                    for tx in rows
+                ]
         return transactions
     except Exception as e:
         msg = f"Error reading transaction data from JSON file '{file_path}': {e}"
@@ -95,14 +109,17 @@ def read_transactions_from_csv(file_path: str) -> List[List[str]]:
     """
     try:
         transactions: List[List[str]] = []
-        with open(file_path, newline='', encoding='utf-8') as csvfile:
+        # Share one string object per distinct item across all transactions
+        intern_map: Dict[str, str] = {}
+        with open(file_path, newline='', encoding='utf-8-sig', buffering=_READ_BUFFER_SIZE) as csvfile:
             reader = csv.reader(csvfile)
             for row in reader:
+                stripped = list(map(str.strip, row))
                 # Check if the row is empty
-                if not row or all(not item.strip() for item in row):
+                if not any(stripped):
                     raise ValueError("Empty or invalid rows are not allowed in the CSV.")
                 # Process valid rows
-                transactions.append([item.strip() for item in row if item.strip()])
+                transactions.append([intern_map.setdefault(item, item) for item in stripped if item])
         return transactions
     except Exception as e:
         msg = f"Error reading transaction data from CSV file '{file_path}': {e}"
@@ -110,10 +127,50 @@ def read_transactions_from_csv(file_path: str) -> List[List[str]]:
         raise ValueError(msg) from e
 
 
+# Transaction reader for each supported file extension
+_EXTENSION_READERS: Dict[str, Callable[[str], List[List[str]]]] = {
+    ".json": read_transactions_from_json,
+    ".csv": read_transactions_from_csv,
+}
+
+
+def sniff_file_extension(file_path: str) -> Optional[str]:
+    """
+    Guess the format of a file from its first bytes.
+
+    Only a small header is read, so the check is cheap regardless of the file size.
+
+    Parameters:
+        file_path (str): Path to the file containing transactions.
+
+    Returns:
+        Optional[str]: `.json` if the content starts with a JSON array or object, `.csv` for other
+                       text content, or None if the file is empty or looks binary.
+
+    Raises:
+        OSError: If the file cannot be opened or read.
+    """
+    with open(file_path, 'rb') as f:
+        head = f.read(64)
+
+    # Skip a UTF-8 BOM (the readers decode with `utf-8-sig`) and leading whitespace
+    if head.startswith(codecs.BOM_UTF8):
+        head = head[len(codecs.BOM_UTF8):]
+    head = head.lstrip(b' \t\r\n')
+    if not head or b'\0' in head:
+        return None
+    if head[:1] in (b'[', b'{'):
+        return ".json"
+    return ".csv"
+
+
 def detect_and_read_file(file_path: str) -> List[List[str]]:
     """
     Detect file format (CSV or JSON) and read transactions.
 
+    The format is taken from the file extension. Files without an extension are
+    identified from their first bytes instead (see `sniff_file_extension`).
+
     Parameters:
         file_path (str): Path to the file containing transactions.
 
@@ -127,15 +184,17 @@ def detect_and_read_file(file_path: str) -> List[List[str]]:
         raise ValueError(f"File '{file_path}' does not exist.")
 
     _, file_extension = os.path.splitext(file_path)
-    file_extension = file_extension.lower()
-
-    if file_extension == ".json":
-        return read_transactions_from_json(file_path)
+    if not file_extension:
+        try:
+            file_extension = sniff_file_extension(file_path) or ""
+        except OSError as e:
+            raise ValueError(f"Unable to read file '{file_path}': {e}") from e
+    reader = _EXTENSION_READERS.get(file_extension.lower())
 
-    if file_extension == ".csv":
-        return read_transactions_from_csv(file_path)
+    if reader is None:
+        raise ValueError("Unsupported file format. Please provide a JSON or CSV file.")
 
-    raise ValueError("Unsupported file format. Please provide a JSON or CSV file.")
+    return reader(file_path)
 
 
 def main() -> None:
@@ -198,10 +257,12 @@ def main() -> None:
         gsp = GSP(transactions)
         patterns: List[Dict[Tuple[str, ...], int]] = gsp.search(min_support=args.min_support)
         logger.info("Frequent Patterns Found:")
-        for i, level in enumerate(patterns, start=1):
-            logger.info(f"\n{i}-Sequence Patterns:")
-            for pattern, support in level.items():
-                logger.info(f"Pattern: {pattern}, Support: {support}")
+        if logger.isEnabledFor(logging.INFO):
+            # One log record per level instead of one per pattern
+            for i, level in enumerate(patterns, start=1):
+                lines = [f"\n{i}-Sequence Patterns:"]
+                lines.extend(f"Pattern: {pattern}, Support: {support}" for pattern, support in level.items())
+                logger.info("\n".join(lines))
     except Exception as e:
         logger.error(f"Error executing GSP algorithm: {e}")
 
@@ -60,6 +60,8 @@ Main Components:
     - `__init__`: Initializes the algorithm with raw transactional data.
     - `_pre_processing`: Validates and preprocesses the input transactions for compatibility.
     - `_worker_batch`: Processes candidate batches to calculate support counts.
+    - `_singleton_support`: Computes the support of 1-item candidates directly from the item index.
+    - `_create_pool`: Starts the worker pool shared by all support computations of a search.
     - `_support`: Computes the support of candidate sequences, using parallel processing for efficiency.
     - `_print_status`: Logs current algorithm progress and candidate filtering.
     - `search`: Executes the GSP algorithm to discover frequent patterns at all k-sequence levels.
@@ -84,16 +86,67 @@ Version:
 --------
 - Current Version: 2.0
 """
+import math
 import logging
 import multiprocessing as mp
-from typing import Any, Dict, List, Tuple
-from itertools import chain
-from collections import Counter
+from typing import Set, Dict, List, Tuple, Iterable, Optional, Sequence, FrozenSet
+from functools import partial
+from collections import Counter, defaultdict
+from multiprocessing.pool import Pool
 
 from gsppy.utils import split_into_batches, is_subsequence_in_list, generate_candidates_from_previous
 
 logger = logging.getLogger(__name__)
 
+# Transactions (with their multiplicities and item index) shared with pool workers,
+# set once per worker by `_init_worker`
+_worker_transactions: List[Tuple[str, ...]] = []
+_worker_weights: List[int] = []
+_worker_item_tids: Dict[str, FrozenSet[int]] = {}
+_worker_total_weight: int = 0
+_worker_max_weight: int = 1
+
+
+def _init_worker(
+    transactions: List[Tuple[str, ...]], weights: List[int], item_tids: Dict[str, FrozenSet[int]]
+) -> None:
+    """
+    Initialize a pool worker with the preprocessed transactions.
+
+    The transactions are handed over once when the worker starts instead of being
+    pickled alongside every batch of candidates. The total and largest transaction
+    weights are fixed for the whole search, so they are computed here once per worker.
+
+    Parameters:
+        transactions (List[Tuple]): Distinct preprocessed transactions as tuples.
+        weights (List[int]): Number of occurrences of each transaction in the dataset.
+        item_tids (Dict[str, FrozenSet[int]]): Indices of the transactions containing each item.
+    """
+    global _worker_transactions, _worker_weights, _worker_item_tids  # pylint: disable=global-statement
+    global _worker_total_weight, _worker_max_weight  # pylint: disable=global-statement
+    _worker_transactions = transactions
+    _worker_weights = weights
+    _worker_item_tids = item_tids
+    _worker_total_weight = sum(weights)
+    _worker_max_weight = max(weights, default=1)
+
+
+def _worker_batch_shared(batch: Sequence[Tuple[str, ...]], min_support: int) -> List[Tuple[Tuple[str, ...], int]]:
+    """
+    Evaluate a batch of candidates against the transactions held by the current worker.
+
+    Parameters:
+        batch (Sequence[Tuple]): A batch of candidate sequences.
+        min_support (int): Absolute minimum support count required for a candidate to be considered frequent.
+
+    Returns:
+        List[Tuple[Tuple, int]]: Frequent candidates of the batch and their support counts.
+    """
+    return GSP._worker_batch(  # pylint: disable=protected-access
+        batch, _worker_transactions, min_support, _worker_weights, _worker_item_tids,
+        _worker_total_weight, _worker_max_weight
+    )
+
 
 class GSP:
     """
@@ -170,43 +223,138 @@ class GSP:
         logger.info("Pre-processing transactions...")
         self.max_size = max(len(item) for item in raw_transactions)
         self.transactions: List[Tuple[str, ...]] = [tuple(transaction) for transaction in raw_transactions]
-        counts: Counter[str] = Counter(chain.from_iterable(raw_transactions))
-        self.unique_candidates: list[tuple[str, Any]] = [(item,) for item in counts.keys()]
+        # Identical transactions are scanned once and weighted by their number of occurrences
+        transaction_counts: Counter[Tuple[str, ...]] = Counter(self.transactions)
+        self._unique_transactions: List[Tuple[str, ...]] = list(transaction_counts.keys())
+        self._transaction_weights: List[int] = list(transaction_counts.values())
+        # Vertical index: for each item, the indices of the (distinct) transactions containing it
+        item_tids: Dict[str, Set[int]] = defaultdict(set)
+        for tid, transaction in enumerate(self._unique_transactions):
+            for item in transaction:
+                item_tids[item].add(tid)
+        self._item_tids: Dict[str, FrozenSet[int]] = {item: frozenset(tids) for item, tids in item_tids.items()}
+        self.unique_candidates: List[Tuple[str, ...]] = [(item,) for item in self._item_tids]
         logger.debug("Unique candidates: %s", self.unique_candidates)
 
     @staticmethod
     def _worker_batch(
-        batch: List[Tuple[str, ...]],
+        batch: Sequence[Tuple[str, ...]],
         transactions: List[Tuple[str, ...]],
-        min_support: int
+        min_support: int,
+        weights: Optional[Sequence[int]] = None,
+        item_tids: Optional[Dict[str, FrozenSet[int]]] = None,
+        total_weight: Optional[int] = None,
+        max_weight: Optional[int] = None
     ) -> List[Tuple[Tuple[str, ...], int]]:
         """
         Evaluate a batch of candidate sequences to compute their support.
 
         This method iterates over the candidates in the given batch and checks their frequency
-        of appearance across all transactions. Candidates meeting the user-defined minimum
-        support threshold are returned.
+        of appearance across all transactions. When an item index is given, only the transactions
+        containing every item of a candidate (the intersection of their index entries) are scanned.
+        Candidates meeting the user-defined minimum support threshold are returned.
 
         Parameters:
-            batch (List[Tuple]): A batch of candidate sequences, where each sequence is represented as a tuple.
+            batch (Sequence[Tuple]): A batch of candidate sequences, where each sequence is represented as a tuple.
             transactions (List[Tuple]): Preprocessed transactions as tuples.
             min_support (int): Absolute minimum support count required for a candidate to be considered frequent.
+            weights (Optional[Sequence[int]]): Number of occurrences of each transaction. Defaults to one
+                                               occurrence per transaction.
+            item_tids (Optional[Dict[str, FrozenSet[int]]]): Indices of the transactions containing each item.
+                                                             Defaults to scanning every transaction.
+            total_weight (Optional[int]): Sum of `weights`. Computed from `weights` when not given.
+            max_weight (Optional[int]): Largest value in `weights`. Computed from `weights` when not given.
 
         Returns:
             List[Tuple[Tuple, int]]: A list of tuples where each tuple contains:
                                      - A candidate sequence.
                                      - The candidate's support count.
         """
+        if weights is None:
+            weights = [1] * len(transactions)
+        all_tids = range(len(transactions))
+        if total_weight is None:
+            total_weight = sum(weights)
+        if max_weight is None:
+            max_weight = max(weights, default=1)
+
         results: List[Tuple[Tuple[str, ...], int]] = []
         for item in batch:
-            frequency = sum(1 for t in transactions if is_subsequence_in_list(item, t))
+            if item_tids is None:
+                tids: Iterable[int] = all_tids
+                remaining = total_weight
+            else:
+                # Intersect starting from the rarest item, so the running intersection is as
+                # small as possible, and stop once too few transactions are left for the
+                # candidate to reach `min_support`
+                tid_sets = sorted((item_tids.get(i, frozenset()) for i in set(item)), key=len)
+                common = tid_sets[0]
+                for other in tid_sets[1:]:
+                    if len(common) * max_weight < min_support:
+                        break
+                    common &= other
+                if len(common) * max_weight < min_support:
+                    continue
+                tids = common
+                # Without duplicate transactions every weight is 1, so the bound is the set size
+                remaining = len(common) if max_weight == 1 else sum(weights[tid] for tid in common)
+
+            # `remaining` bounds the support the candidate can still reach: stop scanning
+            # as soon as the unmatched transactions can no longer lift it to `min_support`
+            frequency = 0
+            for tid in tids:
+                if frequency + remaining < min_support:
+                    break
+                weight = weights[tid]
+                remaining -= weight
+                if is_subsequence_in_list(item, transactions[tid]):
+                    frequency += weight
+
             if frequency >= min_support:
                 results.append((item, frequency))
         return results
 
+    def _singleton_support(self, min_support: int = 0) -> Dict[Tuple[str, ...], int]:
+        """
+        Calculate support counts for the singleton candidates from the item index.
+
+        The support of a 1-item sequence is the number of transactions containing the item,
+        which the item index built during preprocessing already holds, so no transaction scan
+        (and no worker pool) is needed for the first level.
+
+        Parameters:
+            min_support (int): Absolute minimum support count required for a sequence to be considered frequent.
+
+        Returns:
+            Dict[Tuple, int]: A dictionary containing frequent singleton sequences as keys
+                              and their support counts as values.
+        """
+        weights = self._transaction_weights
+        supports = (
+            (candidate, sum(weights[tid] for tid in self._item_tids[candidate[0]]))
+            for candidate in self.unique_candidates
+        )
+        return {candidate: support for candidate, support in supports if support >= min_support}
+
+    def _create_pool(self) -> Pool:
+        """
+        Start a worker pool initialized with the preprocessed transactions.
+
+        Transactions are sent to each worker once, so only candidate batches are pickled per task.
+
+        Returns:
+            Pool: A `multiprocessing` pool with one worker per CPU.
+        """
+        return mp.Pool(
+            processes=mp.cpu_count(),
+            initializer=_init_worker,
+            initargs=(self._unique_transactions, self._transaction_weights, self._item_tids),
+        )
+
     def _support(
         self,
-        items: List[Tuple[str, ...]], min_support: float = 0, batch_size: int = 100
+        items: List[Tuple[str, ...]], min_support: int = 0, batch_size: Optional[int] = None,
+        pool: Optional[Pool] = None
     ) -> Dict[Tuple[str, ...], int]:
         """
         Calculate support counts for candidate sequences, using parallel processing.
@@ -217,27 +365,34 @@ class GSP:
 
         Parameters:
             items (List[Tuple]): Candidate sequences to evaluate.
-            min_support (float): Absolute minimum support count required for a sequence to be considered frequent.
-            batch_size (int): Maximum number of candidates to process per batch.
+            min_support (int): Absolute minimum support count required for a sequence to be considered frequent.
+            batch_size (Optional[int]): Maximum number of candidates to process per batch. Defaults to
+                                        splitting the candidates into about four batches per worker.
+            pool (Optional[Pool]): Worker pool from `_create_pool` to reuse. When omitted, a pool is
+                                   started for this call only.
 
         Returns:
             Dict[Tuple, int]: A dictionary containing frequent sequences as keys
                               and their support counts as values.
         """
-        # Split candidates into batches
-        batches = list(split_into_batches(items, batch_size))
+        if pool is None:
+            with self._create_pool() as own_pool:
+                return self._support(items, min_support, batch_size, own_pool)
+
+        # Split candidates into batches, a few per worker so that uneven batches balance out
+        if batch_size is None:
+            batch_size = max(1, math.ceil(len(items) / (mp.cpu_count() * 4)))
+        batches = split_into_batches(items, batch_size)
 
-        # Use multiprocessing pool to calculate frequency in parallel, batch-wise
-        with mp.Pool(processes=mp.cpu_count()) as pool:
-            batch_results = pool.starmap(
-                self._worker_batch,  # Process a batch at a time
-                [(batch, self.transactions, min_support) for batch in batches]
-            )
+        # Calculate frequency in parallel, batch-wise. Batches are collected lazily
+        # as they complete, keeping the candidates' order in the result
+        results: Dict[Tuple[str, ...], int] = {}
+        for batch_result in pool.imap(partial(_worker_batch_shared, min_support=min_support), batches):
+            results.update(batch_result)
 
-        # Flatten the list of results and convert to a dictionary
-        return {item: freq for batch in batch_results for item, freq in batch}
+        return results
 
-    def _print_status(self, run: int, candidates: List[Tuple[str, ...]]) -> None:
+    def _print_status(self, run: int, candidates: Sequence[Tuple[str, ...]]) -> None:
         """
         Log progress information for the current GSP iteration.
 
@@ -246,7 +401,7 @@ class GSP:
 
         Parameters:
             run (int): Current k-sequence generation level (e.g., 1 for 1-item sequences).
-            candidates (List[Tuple]): Candidate sequences generated at this level.
+            candidates (Sequence[Tuple]): Candidate sequences generated at this level.
         """
         logger.info("Run %d: %d candidates filtered to %d.",
                     run, len(candidates), len(self.freq_patterns[run - 1]))
@@ -280,37 +435,49 @@ class GSP:
         if not 0.0 < min_support <= 1.0:
             raise ValueError("Minimum support must be in the range (0.0, 1.0]")
 
-        min_support = len(self.transactions) * min_support
+        # Supports are integer counts, so `support >= fraction * n` is the same test as
+        # `support >= ceil(fraction * n)`; convert once and compare ints from here on
+        min_support_count = math.ceil(len(self.transactions) * min_support)
 
-        logger.info("Starting GSP algorithm with min_support=%.2f...", min_support)
+        logger.info("Starting GSP algorithm with min_support=%d...", min_support_count)
 
         # the set of frequent 1-sequence: all singleton sequences
         # (k-itemsets/k-sequence = 1) - Initially, every item in DB is a
         # candidate
         candidates = self.unique_candidates
 
-        # scan transactions to collect support count for each candidate
-        # sequence & filter
-        self.freq_patterns.append(self._support(candidates, min_support))
+        # collect support count for each candidate sequence from the item
+        # index & filter
+        self.freq_patterns.append(self._singleton_support(min_support_count))
 
         # (k-itemsets/k-sequence = 1)
         k_items = 1
 
         self._print_status(k_items, candidates)
 
-        # repeat until no frequent sequence or no candidate can be found
-        while self.freq_patterns[k_items - 1] and k_items + 1 <= self.max_size:
-            k_items += 1
-
-            # Generate candidate sets Ck (set of candidate k-sequences) -
-            # generate new candidates from the last "best" candidates filtered
-            # by minimum support
-            candidates = generate_candidates_from_previous(self.freq_patterns[k_items - 2])
-
-            # candidate pruning - eliminates candidates who are not potentially
-            # frequent (using support as threshold)
-            self.freq_patterns.append(self._support(candidates, min_support))
-
-            self._print_status(k_items, candidates)
+        # the worker pool is started on the first level that needs it and
+        # reused by every following level
+        pool: Optional[Pool] = None
+        try:
+            # repeat until no frequent sequence or no candidate can be found
+            while self.freq_patterns[k_items - 1] and k_items + 1 <= self.max_size:
+                k_items += 1
+
+                # Generate candidate sets Ck (set of candidate k-sequences) -
+                # generate new candidates from the last "best" candidates filtered
+                # by minimum support
+                candidates = generate_candidates_from_previous(self.freq_patterns[k_items - 2])
+
+                # candidate pruning - eliminates candidates who are not potentially
+                # frequent (using support as threshold)
+                if pool is None:
+                    pool = self._create_pool()
+                self.freq_patterns.append(self._support(candidates, min_support_count, pool=pool))
+
+                self._print_status(k_items, candidates)
+        finally:
+            if pool is not None:
+                pool.terminate()
+                pool.join()
         logger.info("GSP algorithm completed.")
         return self.freq_patterns[:-1]
@@ -5,24 +5,21 @@ and generating candidate patterns from previously frequent patterns.
 
 The key functionalities include:
 1. Splitting a list of items into smaller batches for easier processing.
-2. Checking for the existence of a contiguous subsequence within a sequence,
-   with caching to optimize repeated comparisons.
+2. Checking for the existence of a contiguous subsequence within a sequence.
 3. Generating candidate patterns from a dictionary of frequent patterns
    to support pattern generation tasks in algorithms like sequence mining.
 
 Main functionalities:
 - `split_into_batches`: Splits a list of items into smaller batches based on a specified batch size.
-- `is_subsequence_in_list`: Determines if a subsequence exists within another sequence,
-  using caching to improve performance.
+- `is_subsequence_in_list`: Determines if a subsequence exists within another sequence.
 - `generate_candidates_from_previous`: Generates candidate patterns by joining previously
   identified frequent patterns.
 
 These utilities are designed to support sequence processing tasks and can be
 adapted to various domains, such as data mining, recommendation systems, and sequence analysis.
 """
-from typing import Dict, List, Tuple, Sequence, Generator
-from functools import lru_cache
-from itertools import product
+from typing import Dict, List, Tuple, Hashable, Sequence, Generator
+from collections import defaultdict
 
 
 def split_into_batches(
@@ -42,8 +39,7 @@ def split_into_batches(
         yield items[i:i + batch_size]
 
 
-@lru_cache(maxsize=None)
-def is_subsequence_in_list(subsequence: Tuple[str, ...], sequence: Tuple[str, ...]) -> bool:
+def is_subsequence_in_list(subsequence: Tuple[Hashable, ...], sequence: Tuple[Hashable, ...]) -> bool:
     """
     Check if a subsequence exists within a sequence as a contiguous subsequence.
 
@@ -64,8 +60,17 @@ def is_subsequence_in_list(subsequence: Tuple[str, ...], sequence: Tuple[str, ..
     if len_sub > len_seq:
         return False
 
-    # Use any to check if any slice matches the sequence
-    return any(sequence[i:i + len_sub] == subsequence for i in range(len_seq - len_sub + 1))
+    # Jump straight to the positions holding the first item (`tuple.index` scans in C)
+    # and only compare a slice there, instead of slicing at every offset
+    first, last_start = subsequence[0], len_seq - len_sub
+    try:
+        i = sequence.index(first, 0, last_start + 1)
+        while True:
+            if sequence[i:i + len_sub] == subsequence:
+                return True
+            i = sequence.index(first, i + 1, last_start + 1)
+    except ValueError:
+        return False
 
 
 def generate_candidates_from_previous(
@@ -74,15 +79,23 @@ def generate_candidates_from_previous(
     """
     Generate joined candidates from the previous level's frequent patterns.
 
+    Two patterns are joined when the suffix of the first (without its first item) equals the
+    prefix of the second (without its last item). Patterns are indexed by their prefix, so each
+    pattern is only paired with the patterns it can actually be joined with.
+
     Parameters:
         prev_patterns (Dict[Tuple, int]): A dictionary of frequent patterns from the previous level.
 
     Returns:
         List[Tuple]: Candidate patterns for the next level.
     """
-    keys = list(prev_patterns.keys())
+    by_prefix: Dict[Tuple[str, ...], List[Tuple[str, ...]]] = defaultdict(list)
+    for pattern in prev_patterns:
+        by_prefix[pattern[:-1]].append(pattern)
+
     return [
         pattern1 + (pattern2[-1],)
-        for pattern1, pattern2 in product(keys, repeat=2)
-        if pattern1[1:] == pattern2[:-1] and not (len(pattern1) == 1 and pattern1 == pattern2)
+        for pattern1 in prev_patterns
+        for pattern2 in by_prefix.get(pattern1[1:], ())
+        if not (len(pattern1) == 1 and pattern1 == pattern2)
     ]
@@ -30,7 +30,7 @@ from unittest.mock import patch
 import pytest
 from pytest import MonkeyPatch
 
-from gsppy.cli import main, detect_and_read_file
+from gsppy.cli import main, detect_and_read_file, sniff_file_extension
 from gsppy.gsp import GSP
 
 
@@ -84,6 +84,16 @@ def unsupported_file() -> Generator[Any, Any, Any]:
     os.unlink(temp_file_name)
 
 
+@pytest.fixture
+def extensionless_file(request: pytest.FixtureRequest) -> Generator[Any, Any, Any]:
+    """Fixture to create a file without extension holding the given content."""
+    with tempfile.NamedTemporaryFile(delete=False, suffix="") as temp_file:
+        temp_file.write(request.param)
+        temp_file_name = temp_file.name
+    yield temp_file_name
+    os.unlink(temp_file_name)
+
+
 def test_valid_json_file(valid_json_file: Generator[Any, Any, Any]):
     """Test if a valid JSON file is correctly read."""
     transactions = detect_and_read_file(str(valid_json_file))
@@ -96,6 +106,14 @@ def test_valid_csv_file(valid_csv_file: Generator[Any, Any, Any]):
     assert transactions == [["Bread", "Milk"], ["Milk", "Diaper"], ["Bread", "Diaper", "Beer"]]
 
 
+def test_repeated_items_are_shared(valid_json_file: Generator[Any, Any, Any], valid_csv_file: Generator[Any, Any, Any]):
+    """Test that repeated items are read into a single shared string object."""
+    for file_path in (valid_json_file, valid_csv_file):
+        transactions = detect_and_read_file(str(file_path))
+        assert transactions[0][1] is transactions[1][0]  # "Milk"
+        assert transactions[0][0] is transactions[2][0]  # "Bread"
+
+
 def test_invalid_json_file(invalid_json_file: Generator[Any, Any, Any]):
     """Test if an invalid JSON file raises an error."""
     with pytest.raises(ValueError, match="Error reading transaction data from JSON file"):
@@ -114,6 +132,69 @@ def test_unsupported_file_format(unsupported_file: Generator[Any, Any, Any]):
         detect_and_read_file(str(unsupported_file))
 
 
+@pytest.mark.parametrize(
+    "extensionless_file, expected",
+    [
+        (b'[["Bread", "Milk"], ["Milk", "Diaper"]]', ".json"),
+        (b'\xef\xbb\xbf\n  [["Bread"]]', ".json"),
+        (b"\xbf\xbb[", ".csv"),
+        (b"Bread,Milk\nMilk,Diaper\n", ".csv"),
+        (b"", None),
+        (b"\x00\x01\x02binary", None),
+    ],
+    indirect=["extensionless_file"],
+)
+def test_sniff_file_extension(extensionless_file: Generator[Any, Any, Any], expected: Any):
+    """Test that the format of a file without extension is guessed from its first bytes."""
+    assert sniff_file_extension(str(extensionless_file)) == expected
+
+
+@pytest.mark.parametrize(
+    "extensionless_file",
+    [b'[["Bread", "Milk"], ["Milk", "Diaper"]]', b"Bread,Milk\nMilk,Diaper\n"],
+    indirect=True,
+)
+def test_extensionless_file(extensionless_file: Generator[Any, Any, Any]):
+    """Test if files without extension are read according to their sniffed format."""
+    transactions = detect_and_read_file(str(extensionless_file))
+    assert transactions == [["Bread", "Milk"], ["Milk", "Diaper"]]
+
+
+@pytest.mark.parametrize("extensionless_file", [b"\x00\x01\x02binary"], indirect=True)
+def test_extensionless_binary_file(extensionless_file: Generator[Any, Any, Any]):
+    """Test if a file without extension and with binary content raises an error."""
+    with pytest.raises(ValueError, match="Unsupported file format"):
+        detect_and_read_file(str(extensionless_file))
+
+
+def test_extensionless_directory():
+    """Test if an extensionless path that cannot be read as a file raises a ValueError."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        with pytest.raises(ValueError, match="Unable to read file"):
+            detect_and_read_file(temp_dir)
+
+
+@pytest.mark.parametrize("suffix", ["", ".json"])
+def test_json_file_with_bom(suffix: str):
+    """Test if a JSON file starting with a UTF-8 BOM is read, with or without extension."""
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as temp_file:
+        temp_file.write(b'\xef\xbb\xbf[["Bread", "Milk"], ["Milk", "Diaper"]]')
+        temp_file_name = temp_file.name
+
+    assert detect_and_read_file(temp_file_name) == [["Bread", "Milk"], ["Milk", "Diaper"]]
+    os.unlink(temp_file_name)
+
+
+def test_csv_file_with_bom():
+    """Test that a UTF-8 BOM does not end up in the first item of a CSV file."""
+    with tempfile.NamedTemporaryFile(delete=False, suffix=".csv") as temp_file:
+        temp_file.write(b"\xef\xbb\xbfBread,Milk\nMilk,Diaper\n")
+        temp_file_name = temp_file.name
+
+    assert detect_and_read_file(temp_file_name) == [["Bread", "Milk"], ["Milk", "Diaper"]]
+    os.unlink(temp_file_name)
+
+
 def test_non_existent_file():
     """Test if a non-existent file raises an error."""
     with pytest.raises(ValueError, match="File 'non_existent_file.json' does not exist."):
@@ -198,6 +279,12 @@ def test_main_valid_json_file(monkeypatch: MonkeyPatch):
         main()
         mock_info.assert_any_call("Frequent Patterns Found:")  # Check for expected log message
 
+    # Each level is logged as a single message holding all of its patterns
+    level_messages = [c.args[0] for c in mock_info.call_args_list if "-Sequence Patterns:" in c.args[0]]
+    assert level_messages[0].startswith("\n1-Sequence Patterns:\n")
+    assert "Pattern: ('Bread',), Support: 2" in level_messages[0].splitlines()
+    assert "Pattern: ('Bread', 'Milk'), Support: 1" in level_messages[1].splitlines()
+
     # Cleanup
     os.unlink(temp_file_name)
 
@@ -19,12 +19,14 @@ Email: jacksonpradolima@gmail.com
 """
 import re
 import random
-from typing import List
+from typing import Dict, List, Tuple, FrozenSet
 
 import pytest
+from pytest import MonkeyPatch
 from pytest_benchmark.fixture import BenchmarkFixture  # type: ignore
 
-from gsppy.gsp import GSP
+import gsppy.gsp as gsp_module
+from gsppy.gsp import GSP, _init_worker, _worker_batch_shared
 
 
 @pytest.fixture
@@ -55,6 +57,22 @@ def random_transactions() -> List[List[str]]:
     return [[random.choice(['A', 'B', 'C', 'D', 'E']) for _ in range(random.randint(2, 10))] for _ in range(100)]
 
 
+def build_item_tids(transactions: List[Tuple[str, ...]]) -> Dict[str, FrozenSet[int]]:
+    """
+    Build the item index expected by `GSP._worker_batch` for the given transactions.
+
+    Parameters:
+        transactions (List[Tuple]): Transactions as tuples.
+
+    Returns:
+        Dict[str, FrozenSet[int]]: For each item, the indices of the transactions containing it.
+    """
+    return {
+        item: frozenset(tid for tid, t in enumerate(transactions) if item in t)
+        for item in {item for t in transactions for item in t}
+    }
+
+
 def test_empty_transactions() -> None:
     """
     Test the GSP algorithm with an empty dataset.
@@ -160,6 +178,80 @@ def test_worker_batch_static_method(supermarket_transactions: List[List[str]]) -
     assert results == expected, f"Expected results {expected}, but got {results}"
 
 
+def test_worker_batch_shared_transactions(supermarket_transactions: List[List[str]], monkeypatch: MonkeyPatch) -> None:
+    """
+    Test that pool workers evaluate batches against the transactions set by the initializer.
+
+    Asserts:
+        - The shared worker yields the same results as `_worker_batch` called with explicit transactions.
+    """
+    batch = [('Bread',), ('Milk',), ('Diaper',), ('Eggs',)]
+    transactions = [tuple(t) for t in supermarket_transactions]
+
+    item_tids = build_item_tids(transactions)
+    # Let monkeypatch restore the worker globals set by the initializer after the test
+    for name in ("_worker_transactions", "_worker_weights", "_worker_item_tids",
+                 "_worker_total_weight", "_worker_max_weight"):
+        monkeypatch.setattr(gsp_module, name, getattr(gsp_module, name))
+    _init_worker(transactions, [1] * len(transactions), item_tids)
+    results = _worker_batch_shared(batch, 3)
+    assert results == GSP._worker_batch(batch, transactions, 3)  # pylint: disable=protected-access
+
+
+@pytest.mark.parametrize("min_support", [1, 5, 20])
+def test_worker_batch_item_index(random_transactions: List[List[str]], min_support: int) -> None:
+    """
+    Test that restricting the scan with the item index does not change the computed supports.
+
+    Asserts:
+        - `_worker_batch` returns the same results with and without the item index, for weighted transactions.
+    """
+    transactions = [tuple(t) for t in random_transactions]
+    weights = [1 + tid % 3 for tid in range(len(transactions))]
+    item_tids = build_item_tids(transactions)
+    batch = [('A', 'B'), ('C',), ('D', 'E', 'A'), ('A', 'A'), ('B', 'C', 'D', 'E'), ('F',)]
+
+    # This test accesses `_worker_batch` to compare both scanning strategies
+    worker_batch = GSP._worker_batch  # pylint: disable=protected-access
+    indexed = worker_batch(batch, transactions, min_support, weights, item_tids)
+    scanned = worker_batch(batch, transactions, min_support, weights)
+    assert indexed == scanned
+
+
+def test_singleton_support(supermarket_transactions: List[List[str]]) -> None:
+    """
+    Test that singleton supports taken from the item index match a full support scan.
+
+    Asserts:
+        - `_singleton_support` returns the same patterns and counts as `_support` on 1-item candidates.
+    """
+    gsp = GSP(supermarket_transactions + [['Bread', 'Milk']])
+    # This test accesses internal methods to compare both support paths
+    singletons = gsp._singleton_support(3)  # pylint: disable=protected-access
+    scanned = gsp._support(gsp.unique_candidates, 3)  # pylint: disable=protected-access
+    assert singletons == scanned == {('Bread',): 5, ('Milk',): 5, ('Diaper',): 4, ('Beer',): 3}
+
+
+def test_duplicate_transactions() -> None:
+    """
+    Test the GSP algorithm with repeated transactions.
+
+    Asserts:
+        - Identical transactions are each counted towards the support of a pattern.
+    """
+    transactions = [['A', 'B']] * 3 + [['B', 'C'], ['C', 'A', 'B']]
+    gsp = GSP(transactions)
+    result = gsp.search(min_support=0.6)
+    expected = [{('A',): 4, ('B',): 5}, {('A', 'B'): 4}]
+    assert result == expected, f"Unexpected patterns for repeated transactions. Got {result}"
+
+    batch = [('A', 'B'), ('B', 'C')]
+    weighted = GSP._worker_batch(  # pylint: disable=protected-access
+        batch, [('A', 'B'), ('B', 'C')], 2, weights=[3, 1]
+    )
+    assert weighted == [(('A', 'B'), 3)]
+
+
 def test_frequent_patterns(supermarket_transactions: List[List[str]]) -> None:
     """
     Test the GSP algorithm with supermarket transactions and a realistic minimum support.
@@ -8,6 +8,7 @@ This module tests the following functions:
 
 Each function is tested for standard cases, edge cases, and error handling to ensure robustness.
 """
+import random
 from typing import Dict, List, Tuple
 
 from gsppy.utils import split_into_batches, is_subsequence_in_list, generate_candidates_from_previous
@@ -59,6 +60,28 @@ def test_is_subsequence_in_list():
     # Test when subsequence length exceeds sequence
     assert not is_subsequence_in_list((1, 2, 3, 4), (1, 2, 3)), "Failed to reject long subsequence"
 
+    # Test a match found only after a failed hit on the first item
+    assert is_subsequence_in_list(("a", "b"), ("a", "c", "a", "b")), "Failed to retry after a partial match"
+    assert is_subsequence_in_list((1, 1, 2), (1, 1, 1, 2)), "Failed to retry on overlapping first items"
+
+    # Test that first-item hits too close to the end of the sequence are not considered
+    assert not is_subsequence_in_list(("b", "c"), ("a", "b", "a", "b")), "Incorrectly matched past the last start"
+    assert not is_subsequence_in_list((2, 3), (2, 1, 2)), "Incorrectly matched a truncated subsequence"
+
+
+def test_is_subsequence_in_list_matches_slicing():
+    """
+    Test `is_subsequence_in_list` against a plain check of every contiguous slice on random sequences.
+    """
+    rng = random.Random(42)
+    for _ in range(2000):
+        sequence = tuple(rng.choices("abc", k=rng.randint(0, 8)))
+        subsequence = tuple(rng.choices("abc", k=rng.randint(1, 4)))
+        expected = any(
+            sequence[i:i + len(subsequence)] == subsequence for i in range(len(sequence) - len(subsequence) + 1)
+        )
+        assert is_subsequence_in_list(subsequence, sequence) == expected, (subsequence, sequence)
+
 
 def test_generate_candidates_from_previous():
     """